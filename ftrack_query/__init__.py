@@ -30,6 +30,10 @@ if TYPE_CHECKING:
     from .query import SessionInstance
 
 
+# Unicode strings are separate from `str` in Python 2
+_STRING_TYPES = (str, type(u''))
+
+
 def select(entity_type):
     # type: (str) -> Select
     """Generate a select statement.
@@ -130,7 +134,7 @@ class FTrackQuery(ftrack_api.Session):
         """Query FTrack for data.
         This method override adds support for setting page size.
         """
-        query = str(expression)
+        query = expression if isinstance(expression, str) else str(expression)
         self.logger.info('Query: %s', query)
 
         # Set page size
@@ -144,7 +148,7 @@ class FTrackQuery(ftrack_api.Session):
     def create(self, entity, data, *args, **kwargs):
         # type: (str, Dict[str, Any], *Any, **Any) -> ftrack_api.entity.base.Entity
         """Create a new entity."""
-        if not kwargs.get('reconstructing', False):
+        if not kwargs.get('reconstructing', False) and self.logger.isEnabledFor(logging.INFO):
             self.logger.info('Create: %s(%s)', entity, utils.dict_to_str(data))
         return super(FTrackQuery, self).create(entity, data, *args, **kwargs)
 
@@ -173,7 +177,9 @@ class FTrackQuery(ftrack_api.Session):
     def populate(self, entities, projections):
         # type: (Union[Entity, Iterable[Entity], QueryResult], Union[str, Iterable[str]]) -> None
         """Populate query with new values."""
-        if not isinstance(projections, (str, type(u''))):
+        if not projections:
+            return
+        if not isinstance(projections, _STRING_TYPES):
             projections = ','.join(map(str, projections))
         super(FTrackQuery, self).populate(entities, projections)
 
@@ -187,7 +193,61 @@ class FTrackQuery(ftrack_api.Session):
             Number of entities updated if an update statement.
             Number of entities deleted if a delete statement.
         """
-        return stmt.options(session=self).execute()
+        # Pass the session directly, as copying the statement would
+        # discard its cached query string
+        return stmt.execute(session=self)
+
+    def execute_many(self, stmts):
+        # type: (Iterable[Select]) -> List[List[Any]]
+        """Execute multiple select statements in a single request.
+        The results are not paged, so each statement requires a limit,
+        and any page size set on the statement is ignored.
+
+        Raises:
+            TypeError: If anything other than a select statement is given.
+            ValueError: If a statement has no limit and is not aggregated.
+
+        Returns:
+            List of results in the same order as the statements.
+            Each result is a list of entities, or the raw data if the
+            statement was aggregated with `group_by`.
+        """
+        # pylint: disable=protected-access
+        batch = []
+        for stmt in stmts:
+            if not isinstance(stmt, Select) or isinstance(stmt, (Update, Delete)):
+                raise TypeError('only select statements can be batched, not {!r}'.format(stmt))
+            if not stmt._limit and not stmt._group_by:
+                raise ValueError('batched statements are not paged and require a limit: '
+                                 '{!r}'.format(str(stmt)))
+            query = str(stmt)
+
+            # Match `Session.query` when no attributes were given
+            if not query.startswith('select '):
+                projections = self.types[stmt._entity].default_projections
+                query = 'select {} from {}'.format(', '.join(projections), query)
+
+            self.logger.info('Query: %s', query)
+            batch.append({'action': 'query', 'expression': query})
+
+        if not batch:
+            return []
+
+        merged = {}  # type: Dict[Any, Any]
+        return [self._merge_query_data(result['data'], merged) for result in self.call(batch)]
+
+    def _merge_query_data(self, data, merged):
+        # type: (List[Any], Dict[Any, Any]) -> List[Any]
+        """Merge the data from a raw query result into the session.
+
+        This mirrors what `ftrack_api.Session._query` does with each
+        result, and relies on the private `Session._merge_recursive`,
+        as the public `merge` does not merge nested attributes.
+        """
+        for i, item in enumerate(data):
+            if isinstance(item, ftrack_api.entity.base.Entity):
+                data[i] = self._merge_recursive(item, merged)
+        return data
 
     @copy_doc(select)
     def select(self, entity_type):
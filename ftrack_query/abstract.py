@@ -1,22 +1,26 @@
 # pylint: disable=consider-using-f-string, useless-object-inheritance
 """Base classes for both the query and event syntax."""
 
-from collections import defaultdict
 from types import GeneratorType
 
-import ftrack_api  # type: ignore
-
 from .type_hints import TYPE_CHECKING
-from .utils import convert_output_value, reverse_value
+from .utils import is_entity, parse_value, reverse_value
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, Dict, Iterator, Tuple, Union
+    from typing import Any, Callable, Dict, List, Optional
 
 
 class Comparison(object):
     """Abstract class for attribute comparisons."""
 
-    Operators = defaultdict(dict)  # type: Dict[type, Dict[str, Callable]]
+    __slots__ = ('value',)
+
+    # Operators registered to the class, such as "and"/"or"
+    _operators = {}  # type: Dict[str, Callable]
+
+    # Format used for equality and keyword arguments, such as "x is y"
+    # This depends on the syntax, so must be set by each subclass
+    _eq_format = None  # type: Optional[str]
 
     def __init__(self, value):
         # type: (str) -> None
@@ -49,6 +53,12 @@ class Comparison(object):
         """Setup .is_not() as an alias to not equals."""
         return self != value
 
+    @classmethod
+    def _eq(cls, key, value):
+        # type: (str, Any) -> str
+        """Build an equality comparison string."""
+        return cls._eq_format % parse_value(key, value)
+
     @classmethod
     def register_operator(cls, name, brackets):
         # type: (str, bool) -> Callable
@@ -61,16 +71,40 @@ class Comparison(object):
                 "and" and "or" are examples.
             brackets: If multiple values need to be parenthesized.
         """
+        separator = ' %s ' % name
+
         def operator(*args, **kwargs):
             # type: (*Any, **Any) -> Comparison
             """Create a comparison object containing all the inputs."""
-            query_parts = list(cls.parser(*(arg for arg in args if arg is not None), **kwargs))
-            query = ' {} '.format(name).join(map(str, query_parts))
+            # Skip the parser for the simplest inputs
+            if not args:
+                if not kwargs:
+                    return cls('')
+                query_parts = [cls._eq(key, value) for key, value in kwargs.items()]
+            else:
+                if not kwargs:
+                    if len(args) == 1:
+                        if isinstance(args[0], cls):
+                            return args[0]
+                        if isinstance(args[0], str):
+                            return cls(args[0])
+                    # Joining two comparisons is the most common use
+                    elif len(args) == 2 and isinstance(args[0], cls) and isinstance(args[1], cls):
+                        query = args[0].value + separator + args[1].value
+                        if brackets:
+                            return cls('(' + query + ')')
+                        return cls(query)
+                query_parts = cls.parser(*(arg for arg in args if arg is not None), **kwargs)
+
+            query = separator.join(query_parts)
             if brackets and len(query_parts) > 1:
-                return cls('({})'.format(query))
+                return cls('(' + query + ')')
             return cls(query)
 
-        cls.Operators[cls][name] = operator
+        # Give each class its own registry rather than sharing the parent's
+        if '_operators' not in cls.__dict__:
+            cls._operators = {}
+        cls._operators[name] = operator
         return operator
 
     @classmethod
@@ -78,34 +112,34 @@ class Comparison(object):
         # type: (str) -> Callable
         """Get an existing operator."""
         try:
-            return cls.Operators[cls][operator]
+            return cls._operators[operator]
         except KeyError:
             raise AttributeError('no operator named "{}"'.format(operator))  # pylint: disable=raise-missing-from
 
     def __and__(self, other):
         # type: (Any) -> Comparison
         """Join two comparisons."""
-        return self.operator('and')(self, other)
+        return self._operators['and'](self, other)
 
     def __rand__(self, other):
         # type: (Any) -> Comparison
         """Join two comparisons."""
-        return self.operator('and')(other, self)
+        return self._operators['and'](other, self)
 
     def __or__(self, other):
         # type: (Any) -> Comparison
         """Join two comparisons."""
-        return self.operator('or')(self, other)
+        return self._operators['or'](self, other)
 
     def __ror__(self, other):
         # type: (Any) -> Comparison
         """Join two comparisons."""
-        return self.operator('or')(other, self)
+        return self._operators['or'](other, self)
 
     @classmethod
     def parser(cls, *args, **kwargs):
-        # type: (*Any, **Any) -> Iterator[Union[Comparison, str]]
-        """Convert multiple inputs into `Comparison` objects.
+        # type: (*Any, **Any) -> List[str]
+        """Convert multiple inputs into comparison strings.
         Different types of arguments are allowed.
 
         args:
@@ -131,37 +165,28 @@ class Comparison(object):
             TypeError: If entity is given with no keyword.
 
         Returns:
-            List of `Comparison` objects or strings.
+            List of strings.
         """
+        query_parts = []  # type: List[str]
         for arg in args:
-            if isinstance(arg, dict):
+            if isinstance(arg, Comparison):
+                query_parts.append(arg.value)
+
+            elif isinstance(arg, dict):
                 for key, value in arg.items():
-                    yield cls(key) == value
+                    query_parts.append(cls._eq(key, value))
 
-            elif isinstance(arg, ftrack_api.entity.base.Entity):
+            elif is_entity(arg):
                 raise TypeError('keyword required for {}'.format(arg))
 
             elif isinstance(arg, GeneratorType) and len(args) == 1:
                 for item in arg:
-                    yield item
+                    query_parts.append(item.value if isinstance(item, Comparison) else str(item))
 
-            # The object is likely a `Comparison` object at this point
             # If anything else is input, then assume it's valid syntax
             else:
-                yield arg
+                query_parts.append(str(arg))
 
         for key, value in kwargs.items():
-            yield cls(key) == value
-
-    def _get_value_base(self, value):
-        # type: (Any) -> Tuple[str, str]
-        """Use the input value to get the base and actual value required.
-
-        For example with "a=b", then the base is "a" and value is "b".
-        However if "project=<ProjectEntity>", then the base should be
-        "project.id", and the value "<ProjectEntity>['id']".
-        """
-        base = self.value
-        if isinstance(value, ftrack_api.entity.base.Entity):
-            base += '.id'
-        return base, convert_output_value(value)
+            query_parts.append(cls._eq(key, value))
+        return query_parts
@@ -16,6 +16,7 @@ __all__ = ['and_', 'or_', 'not_']
 
 from . import abstract
 from .type_hints import TYPE_CHECKING
+from .utils import parse_value
 
 if TYPE_CHECKING:
     from typing import Any
@@ -24,35 +25,39 @@ if TYPE_CHECKING:
 class Comparison(abstract.Comparison):
     """Comparisons for the event syntax."""
 
+    __slots__ = ()
+
+    _eq_format = '%s=%s'
+
     def __eq__(self, value):  # type: ignore
         # type: (Any) -> Comparison
         """If a value is exactly equal."""
-        return type(self)('{}={}'.format(*self._get_value_base(value)))
+        return type(self)(self._eq(self.value, value))
 
     def __ne__(self, value):  # type: ignore
         # type: (Any) -> Comparison
         """If a value is not exactly equal."""
-        return type(self)('{}!={}'.format(*self._get_value_base(value)))
+        return type(self)('%s!=%s' % parse_value(self.value, value))
 
     def __gt__(self, value):
         # type: (Any) -> Comparison
         """If a value is greater than."""
-        return type(self)('{}>{}'.format(*self._get_value_base(value)))
+        return type(self)('%s>%s' % parse_value(self.value, value))
 
     def __ge__(self, value):
         # type: (Any) -> Comparison
         """If a value is greater than or equal."""
-        return type(self)('{}>={}'.format(*self._get_value_base(value)))
+        return type(self)('%s>=%s' % parse_value(self.value, value))
 
     def __lt__(self, value):
         # type: (Any) -> Comparison
         """If a value is less than."""
-        return type(self)('{}<{}'.format(*self._get_value_base(value)))
+        return type(self)('%s<%s' % parse_value(self.value, value))
 
     def __le__(self, value):
         # type: (Any) -> Comparison
         """If a value is less than or equal."""
-        return type(self)('{}<={}'.format(*self._get_value_base(value)))
+        return type(self)('%s<=%s' % parse_value(self.value, value))
 
 
 def attr(value):
@@ -38,7 +38,10 @@ import ftrack_api  # type: ignore
 from . import abstract
 from .exception import UnboundSessionError
 from .type_hints import TYPE_CHECKING
-from .utils import NotSet, NOT_SET, clone_instance, convert_output_value, dict_to_str
+from .utils import (
+    NotSet, NOT_SET, clone_instance, convert_output_value, dict_to_str, is_entity, parse_value,
+    str_list,
+)
 
 if TYPE_CHECKING:
     from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
@@ -48,88 +51,92 @@ if TYPE_CHECKING:
 class Comparison(abstract.Comparison):
     """Comparisons for the query syntax."""
 
+    __slots__ = ()
+
+    _eq_format = '%s is %s'
+
     def descending(self):
         # type: () -> str
         """Use the current attribute as part of a descending sort."""
-        return '{} descending'.format(self.value)
+        return '%s descending' % self.value
     desc = descending
 
     def ascending(self):
         # type: () -> str
         """Use the current attribute as part of an ascending sort."""
-        return '{} ascending'.format(self.value)
+        return '%s ascending' % self.value
     asc = ascending
 
     def __contains__(self, value):
         # type: (Any) -> None
         """Provide an alternative suggestion when using `x in obj`."""
         raise TypeError("'in' cannot be overloaded, use {!r} instead".format(
-            str(type(self)('{} like {}'.format(*self._get_value_base(value)))),
+            '%s like %s' % parse_value(self.value, value),
         ))
 
     def __eq__(self, value):  # type: ignore
         # type: (Any) -> Comparison
         """If a value is exactly equal."""
-        return type(self)('{} is {}'.format(*self._get_value_base(value)))
+        return type(self)(self._eq(self.value, value))
 
     def __ne__(self, value):  # type: ignore
         # type: (Any) -> Comparison
         """If a value is not exactly equal."""
-        return type(self)('{} is_not {}'.format(*self._get_value_base(value)))
+        return type(self)('%s is_not %s' % parse_value(self.value, value))
 
     def __gt__(self, value):
         # type: (Any) -> Comparison
         """If a value is greater than."""
-        return type(self)('{} > {}'.format(*self._get_value_base(value)))
+        return type(self)('%s > %s' % parse_value(self.value, value))
 
     def __ge__(self, value):
         # type: (Any) -> Comparison
         """If a value is greater than or equal."""
-        return type(self)('{} >= {}'.format(*self._get_value_base(value)))
+        return type(self)('%s >= %s' % parse_value(self.value, value))
 
     def __lt__(self, value):
         # type: (Any) -> Comparison
         """If a value is less than."""
-        return type(self)('{} < {}'.format(*self._get_value_base(value)))
+        return type(self)('%s < %s' % parse_value(self.value, value))
 
     def __le__(self, value):
         # type: (Any) -> Comparison
         """If a value is less than or equal."""
-        return type(self)('{} <= {}'.format(*self._get_value_base(value)))
+        return type(self)('%s <= %s' % parse_value(self.value, value))
 
     def like(self, value):
         # type: (str) -> Comparison
         """If a value matches a pattern.
         The percent symbol (%) is used as a wildcard.
         """
-        return type(self)('{} like {}'.format(*self._get_value_base(value)))
+        return type(self)('%s like %s' % parse_value(self.value, value))
 
     def not_like(self, value):
         # type: (str) -> Comparison
         """If a value does not match a pattern.
         The percent symbol (%) sign is used as a wildcard.
         """
-        return type(self)('{} not_like {}'.format(*self._get_value_base(value)))
+        return type(self)('%s not_like %s' % parse_value(self.value, value))
 
     def after(self, value):
         # type: (Any) -> Comparison
         """If a date is after."""
-        return type(self)('{} after {}'.format(*self._get_value_base(value)))
+        return type(self)('%s after %s' % parse_value(self.value, value))
 
     def before(self, value):
         # type: (Any) -> Comparison
         """If a date is before."""
-        return type(self)('{} before {}'.format(*self._get_value_base(value)))
+        return type(self)('%s before %s' % parse_value(self.value, value))
 
     def has(self, *args, **kwargs):
         # type: (*Any, **Any) -> Comparison
         """Test a scalar relationship for values."""
-        return type(self)('{} has ({})'.format(self.value, and_(*args, **kwargs)))
+        return type(self)('%s has (%s)' % (self.value, and_(*args, **kwargs).value))
 
     def any(self, *args, **kwargs):
         # type: (*Any, **Any) -> Comparison
         """Test a collection relationship for values."""
-        return type(self)('{} any ({})'.format(self.value, and_(*args, **kwargs)))
+        return type(self)('%s any (%s)' % (self.value, and_(*args, **kwargs).value))
 
     def _prepare_in_subquery(self, values=None):
         # type: (Any) -> Tuple[str, str]
@@ -157,11 +164,10 @@ class Comparison(abstract.Comparison):
             return '', values
 
         # Handle FTrack entity instances
-        ftrack_entities = [isinstance(value, ftrack_api.entity.base.Entity) for value in values]
-        if all(ftrack_entities):
+        if any(is_entity(value) for value in values):
+            if not all(is_entity(value) for value in values):
+                raise ValueError('values cannot be a mix of types when entities are used')
             return '.id', ', '.join(convert_output_value(entity['id']) for entity in values)
-        if any(ftrack_entities):
-            raise ValueError('values cannot be a mix of types when entities are used')
 
         # Correctly format a list of arguments based on their type
         return '', ', '.join(map(convert_output_value, values))
@@ -172,7 +178,7 @@ class Comparison(abstract.Comparison):
         See _prepare_in_subquery() for implementation details.
         """
         suffix, subquery = self._prepare_in_subquery(values)
-        return type(self)('{}{} in ({})'.format(self.value, suffix, subquery))
+        return type(self)('%s%s in (%s)' % (self.value, suffix, subquery))
 
     def not_in(self, values=None):
         # type: (Any) -> Comparison
@@ -180,7 +186,7 @@ class Comparison(abstract.Comparison):
         See _prepare_in_subquery() for implementation details.
         """
         suffix, subquery = self._prepare_in_subquery(values)
-        return type(self)('{}{} not_in ({})'.format(self.value, suffix, subquery))
+        return type(self)('%s%s not_in (%s)' % (self.value, suffix, subquery))
 
     def startswith(self, value):
         # type: (str) -> Comparison
@@ -201,6 +207,8 @@ class Comparison(abstract.Comparison):
 class SessionInstance(object):
     """Base class to hold the session and entity."""
 
+    __slots__ = ('_entity', '_session')
+
     def __init__(self, entity_type):
         # type: (str) -> None
         self._entity = entity_type
@@ -209,8 +217,12 @@ class SessionInstance(object):
     def copy(self):
         # type: () -> SessionInstance
         # pylint: disable=protected-access
-        """Create a new copy of the class."""
-        new = type(self)(entity_type=self._entity)
+        """Create a new copy of the class.
+        This skips `__init__`, so each subclass must copy every attribute
+        it defines.
+        """
+        new = object.__new__(type(self))
+        new._entity = self._entity
         new._session = self._session
         return new
 
@@ -258,22 +270,27 @@ class Select(SessionInstance):
         <Task>
     """
 
+    __slots__ = ('_populate', '_sort', '_offset', '_limit', '_page_size', '_where', '_group_by',
+                 '_str_cache')
+
     def __init__(self, entity_type):
         super(Select, self).__init__(entity_type=entity_type)
-        self._populate = []
-        self._sort = []
+        self._populate = ()  # type: Tuple[str, ...]
+        self._sort = ()  # type: Tuple[Tuple[str, bool], ...]
         self._offset = 0
         self._limit = 0
         self._page_size = None
-        self._where = []
-        self._group_by = []
+        self._where = ()  # type: Tuple[str, ...]
+        self._group_by = ()  # type: Tuple[str, ...]
+        self._str_cache = None  # type: Optional[str]
 
     def __len__(self):
         # type: () -> int
         """Get the number of results.
         This executes the query so should not be used lightly.
+        See `count` for details.
         """
-        return len(self.all())
+        return self.count()
 
     def __bool__(self):
         # type: () -> bool
@@ -282,28 +299,47 @@ class Select(SessionInstance):
 
     def __str__(self):
         # type: () -> str
-        """Generate a string from the query data."""
-        query = []
+        """Generate a string from the query data.
+        The result is cached, which is safe as every method that
+        modifies the query returns a new instance.
+        """
+        if self._str_cache is None:
+            if not (self._populate or self._where or self._group_by or self._sort
+                    or self._offset or self._limit):
+                self._str_cache = self._entity or ''
+            else:
+                query = []  # type: List[str]
+                self._render(query)
+                self._str_cache = ' '.join(query)
+        return self._str_cache
+
+    def _render(self, query):
+        # type: (List[str]) -> None
+        """Add each part of the query to a list, to be joined by spaces.
+        Empty parts are never added.
+        """
         if self._populate:
             query.append('select')
             query.append(', '.join(self._populate))
             query.append('from')
-        query.append(self._entity)
-        query.append(str(and_(*self._where)))
-        if query[-1]:
-            query.insert(-1, 'where')
+        if self._entity:
+            query.append(self._entity)
+        if self._where:
+            query.append('where')
+            query.append(' and '.join(self._where))
         if self._group_by:
-            query += ['group by', ', '.join(self._group_by)]
+            query.append('group by')
+            query.append(', '.join(self._group_by))
         if self._sort:
             query.append('order by')
-            sort = ('{}{}'.format(value, ('', ' descending')[descending])
-                    for value, descending in self._sort)
-            query.append(', '.join(sort))
+            query.append(', '.join([value + ' descending' if descending else value
+                                    for value, descending in self._sort]))
         if self._offset:
-            query += ['offset', str(self._offset)]
+            query.append('offset')
+            query.append(str(self._offset))
         if self._limit:
-            query += ['limit', str(self._limit)]
-        return ' '.join(filter(bool, query))
+            query.append('limit')
+            query.append(str(self._limit))
 
     def __iter__(self):
         # type: () -> Iterator[ftrack_api.entity.base.Entity]
@@ -313,19 +349,22 @@ class Select(SessionInstance):
     def copy(self):
         # type: () -> Select
         # pylint: disable=protected-access
-        """Create a new copy of the class."""
+        """Create a new copy of the class.
+        The query parts are immutable tuples, so they can be shared
+        between copies. The cached string is not copied.
+        """
         new = super(Select, self).copy()
         if TYPE_CHECKING:
             assert isinstance(new, Select)
 
-        new._entity = self._entity
-        new._where = list(self._where)
-        new._populate = list(self._populate)
-        new._group_by = list(self._group_by)
-        new._sort = list(self._sort)
+        new._where = self._where
+        new._populate = self._populate
+        new._group_by = self._group_by
+        new._sort = self._sort
         new._offset = self._offset
         new._limit = self._limit
         new._page_size = self._page_size
+        new._str_cache = None
         return new
 
     def execute(self, session=None):
@@ -370,24 +409,57 @@ class Select(SessionInstance):
         """Returns every query result."""
         return self.execute().all()
 
+    def count(self, session=None):
+        # type: (Optional[FTrackQuery]) -> int
+        """Get the number of results.
+        Only the IDs of the matching entities are fetched, unless the
+        results are being aggregated. This also works on update and
+        delete statements, without making any changes.
+
+        Raises:
+            UnboundSessionError: If the session hasn't been set.
+        """
+        if self._group_by:
+            return len(Select.execute(self, session))
+        session = self._get_session(session)
+        stmt = Select.__str__(self.subquery('id'))
+        return len(session.query(stmt, page_size=self._page_size).all())
+
     @clone_instance
     def where(self, *args, **kwargs):
         # type: (*Any, **Any) -> Select
         """Filter the result."""
-        self._where.append(and_(*args, **kwargs))
+        # Skip the parser for the common `where(key=value)` case
+        if not args:
+            self._where += tuple(Comparison._eq(key, value) for key, value in kwargs.items())
+        else:
+            where = and_(*args, **kwargs).value
+            if where:
+                self._where += (where,)
         return self
 
     @clone_instance
     def populate(self, *args):
         # type: (*Optional[str]) -> Select
-        """Prefetch attributes as part of the query."""
-        self._populate.extend(map(str, filter(bool, args)))
+        """Prefetch attributes as part of the query.
+        Attributes that are already being populated are skipped.
+        """
+        seen = set(self._populate)
+        new = []  # type: List[str]
+        for arg in str_list(args):
+            if arg not in seen:
+                seen.add(arg)
+                new.append(arg)
+        self._populate += tuple(new)
         return self
 
     @clone_instance
     def sort(self, sort=None):
         # type: (Optional[str]) -> Select
-        """Sort the query results."""
+        """Sort the query results.
+        If an attribute is already being sorted, the earlier sort takes
+        priority, so the new one is skipped.
+        """
         desc = False
 
         # Grab the sorting method from the string if provided
@@ -401,9 +473,9 @@ class Select(SessionInstance):
                     raise NotImplementedError('unknown sorting method: {!r}'.format(method))
 
         if sort is None:
-            self._sort = []
-        else:
-            self._sort.append((sort, desc))
+            self._sort = ()
+        elif all(sort != value for value, _ in self._sort):
+            self._sort += ((sort, desc),)
         return self
     order = order_by = sort
 
@@ -418,7 +490,7 @@ class Select(SessionInstance):
         the query will fail.
         https://ftrack-python-api.readthedocs.io/en/stable/example/group_by.html
         """
-        self._group_by.extend(map(str, filter(bool, args)))
+        self._group_by += tuple(str_list(args))
         return self
 
     @clone_instance
@@ -443,7 +515,7 @@ class Select(SessionInstance):
         have any effect if no sorts have been performed. Any future
         sorts are not affected.
         """
-        self._sort = [(attr, not order) for attr, order in self._sort]
+        self._sort = tuple((attr, not order) for attr, order in self._sort)
         return self
     reverse = __reversed__
 
@@ -468,7 +540,7 @@ class Select(SessionInstance):
         the statement.
         """
         if attribute is not None or not self._populate:
-            self._populate[:] = [attribute or 'id']
+            self._populate = (attribute or 'id',)
         return self
 
 
@@ -484,6 +556,8 @@ class Create(SessionInstance):
         <Task>
     """
 
+    __slots__ = ('_values',)
+
     def __init__(self, entity_type):
         # type: (str) -> None
         self._values = {}  # type: Dict[str, Any]
@@ -502,7 +576,7 @@ class Create(SessionInstance):
         if TYPE_CHECKING:
             assert isinstance(new, Create)
 
-        new._values = self._values.copy()
+        new._values = self._values
         return new
 
     @clone_instance
@@ -512,7 +586,7 @@ class Create(SessionInstance):
         for key, value in kwargs.items():
             if isinstance(value, GeneratorType):
                 kwargs[key] = list(value)
-        self._values.update(kwargs)
+        self._values = dict(self._values, **kwargs)
         return self
 
     def execute(self, session=None):
@@ -536,6 +610,8 @@ class Update(Select):
         1
     """
 
+    __slots__ = ('_values',)
+
     def __init__(self, entity_type):
         # type: (str) -> None
         self._values = {}  # type: Dict[str, Any]
@@ -549,7 +625,7 @@ class Update(Select):
         if TYPE_CHECKING:
             assert isinstance(new, Update)
 
-        new._values = self._values.copy()
+        new._values = self._values
         return new
 
     def populate(self, *args):
@@ -575,7 +651,7 @@ class Update(Select):
         for key, value in kwargs.items():
             if isinstance(value, GeneratorType):
                 kwargs[key] = list(value)
-        self._values.update(kwargs)
+        self._values = dict(self._values, **kwargs)
         return self
 
     def execute(self, session=None):
@@ -605,6 +681,8 @@ class Delete(Select):
         1
     """
 
+    __slots__ = ('_remove_components',)
+
     def __init__(self, entity_type):
         # type: (str) -> None
         self._remove_components = False  # type: Optional[bool]
@@ -4,12 +4,12 @@
 import re
 from functools import wraps
 
-import ftrack_api  # type: ignore
+from ftrack_api.entity.base import Entity  # type: ignore
 
 from .type_hints import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, Dict, Iterator
+    from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
     from .query import SessionInstance
 
 
@@ -23,6 +23,17 @@ class NotSet(object):  # pylint: disable=too-few-public-methods
 
 NOT_SET = NotSet()
 
+# Match brackets, or entire quoted strings so they can be skipped
+_BRACKET_TOKENS = re.compile(r'"[^"]*"|[()]')
+
+# Match any "and"/"or" keywords
+_AND_OR = re.compile(r'\b(and|or)\b')
+
+# Types that have already been checked and are not entities
+_NON_ENTITY_TYPES = set()  # type: Set[type]
+
+_NON_ENTITY_TYPES_SIZE = 256
+
 
 def clone_instance(func):
     # type: (Callable) -> Callable
@@ -39,29 +50,70 @@ def clone_instance(func):
 def dict_to_str(dct):
     # type: (Dict[Any, Any]) -> str
     """Convert a dict to a string."""
-    def convert(dct):
-        # type: (Dict[str, Any]) -> Iterator[str]
-        for key, value in dct.items():
-            if isinstance(value, ftrack_api.entity.base.Entity):
-                value = str(value)
-            else:
-                value = repr(value)
-            yield '{}={}'.format(key, value)
-    return ', '.join(convert(dct))
+    return ', '.join(['%s=%s' % (key, str(value) if is_entity(value) else repr(value))
+                      for key, value in dct.items()])
+
+
+def is_entity(value):
+    # type: (Any) -> bool
+    """Check if a value is an FTrack entity.
+
+    `Entity` is an abstract class, which makes `isinstance` slow, so
+    types that are not entities are remembered. This keeps a reference
+    to each of those types, so the set is cleared once it gets too
+    large. Values that override `__class__`, such as mocks, are not
+    remembered, as `isinstance` may give a different result for them.
+    """
+    value_type = type(value)
+    if value_type in _NON_ENTITY_TYPES:
+        return False
+    if isinstance(value, Entity):
+        return True
+    if value.__class__ is value_type:
+        if len(_NON_ENTITY_TYPES) >= _NON_ENTITY_TYPES_SIZE:
+            _NON_ENTITY_TYPES.clear()
+        _NON_ENTITY_TYPES.add(value_type)
+    return False
 
 
 def convert_output_value(value):
     # type: (Any) -> str
     """Convert the output value to something that FTrack understands."""
+    # Strings are checked first, as the `Entity` check is slower
+    if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+        return '"' + value.replace('"', r'\"') + '"'
     if value is None:
         return 'none'
     if isinstance(value, (float, int)):
         return str(value)
-    if isinstance(value, ftrack_api.entity.base.Entity):
+    if is_entity(value):
         return value['id']
     return '"' + str(value).replace('"', r'\"') + '"'
 
 
+def parse_value(base, value):
+    # type: (str, Any) -> Tuple[str, str]
+    """Use the input value to get the base and actual value required.
+
+    For example with "a=b", then the base is "a" and value is "b".
+    However if "project=<ProjectEntity>", then the base should be
+    "project.id", and the value "<ProjectEntity>['id']".
+    """
+    # Strings are checked first, as the `Entity` check is slower
+    if type(value) is not str and is_entity(value):  # pylint: disable=unidiomatic-typecheck
+        return base + '.id', value['id']
+    return base, convert_output_value(value)
+
+
+def str_list(values):
+    # type: (Iterable[Any]) -> List[str]
+    """Convert each non empty value to a string.
+    Strings are kept as they are, as they are the most common input.
+    """
+    return [value if type(value) is str else str(value)  # pylint: disable=unidiomatic-typecheck
+            for value in values if value]
+
+
 def copy_doc(from_fn):
     # type: (Callable) -> Callable
     """Copy a docstring from one function to another."""
@@ -78,14 +130,13 @@ def _requires_extra_brackets(value):
     For example "(a or b) and (y or z)" does need extra brackets,
     whereas "(a and b)" does not.
     """
-    if value[0] != '(' or value[-1] != ')':
+    if not (value.startswith('(') and value.endswith(')')):
         return True
-    value = re.sub(r'"[^"]*"', '', value)  # Remove quotes
     depth = 0
-    for char in value[1:-1]:
-        if char == '(':
+    for token in _BRACKET_TOKENS.findall(value, 1, len(value) - 1):
+        if token == '(':
             depth += 1
-        elif char == ')':
+        elif token == ')':
             depth -= 1
             if depth < 0:
                 return True
@@ -131,17 +182,17 @@ def reverse_value(value):
         'not ((a and b)'
     """
     input_value = value = value.strip()
-    is_reversed = value[:4] == 'not '
+    is_reversed = value.startswith('not ')
     if is_reversed:
         value = value[4:].lstrip()
     if not value:
         return ''
 
     if _requires_extra_brackets(value):
-        if bool(re.search(r'\b(and|or)\b', value)):
-            return 'not ({})'.format(input_value)
+        if _AND_OR.search(value):
+            return 'not (%s)' % input_value
         if is_reversed:
             return value
     if is_reversed:
         return value[1:-1]
-    return 'not {}'.format(value)
+    return 'not ' + value
@@ -3,7 +3,8 @@ import unittest
 import sys
 
 sys.path.insert(0, os.path.normpath(os.path.dirname(__file__)).rsplit(os.path.sep, 1)[0])
-from ftrack_query import attr, or_, and_, not_, select, create, update, delete, event
+from ftrack_api.entity.base import Entity
+from ftrack_query import attr, or_, and_, not_, select, create, update, delete, event, utils
 
 
 class TestAttr(unittest.TestCase):
@@ -148,9 +149,13 @@ class TestSelect(unittest.TestCase):
 
     def test_populate(self):
         self.assertEqual(str(select('Task').populate('name', 'project.name')), 'select name, project.name from Task')
+        self.assertEqual(str(select('Task').populate('name').populate('id', 'name')), 'select name, id from Task')
 
     def test_where(self):
         self.assertEqual(str(select('Task').where(name='abc')), 'Task where name is "abc"')
+        self.assertEqual(str(select('Task').where(name='abc', version=1)), 'Task where name is "abc" and version is 1')
+        self.assertEqual(str(select('Task').where(name='abc').where(attr('version') > 1, id=5)),
+                         'Task where name is "abc" and version > 1 and id is 5')
 
     def test_sort(self):
         self.assertEqual(str(select('Task').sort('name')), 'Task order by name')
@@ -162,6 +167,7 @@ class TestSelect(unittest.TestCase):
         self.assertEqual(str(select('Task').order_by('name')), 'Task order by name')
         self.assertEqual(str(reversed(select('Task').sort('name'))), 'Task order by name descending')
         self.assertEqual(str(reversed(select('Task').sort('name')).sort('project.name')), 'Task order by name descending, project.name')
+        self.assertEqual(str(select('Task').sort('name').sort('id').sort('name desc')), 'Task order by name, id')
 
     def test_limit(self):
         self.assertEqual(str(select('Task').limit(10)), 'Task limit 10')
@@ -195,6 +201,13 @@ class TestSelect(unittest.TestCase):
         self.assertEqual(str(query.limit(10)), str(query2))
         self.assertNotEqual(str(query.limit(11)), str(query2))
 
+    def test_str_cache(self):
+        query = select('Task').where(name='abc')
+        self.assertIs(str(query), str(query))
+        self.assertEqual(str(query.limit(1)), 'Task where name is "abc" limit 1')
+        self.assertEqual(str(query.where(id=1)), 'Task where name is "abc" and id is 1')
+        self.assertEqual(str(query), 'Task where name is "abc"')
+
     def test_group_by(self):
         query = (
             select('Task')
@@ -293,5 +306,38 @@ class TestDelete(unittest.TestCase):
             delete('Task').group_by('name')
 
 
+
+class TestEntityCheck(unittest.TestCase):
+
+    def test_class_override(self):
+        class Task(Entity):
+            pass
+
+        class Proxy(object):
+            proxy_class = object
+
+            @property
+            def __class__(self):
+                return self.proxy_class
+
+        proxy = Proxy()
+        self.assertFalse(utils.is_entity(proxy))
+        proxy.proxy_class = Task
+        self.assertTrue(utils.is_entity(proxy))
+
+    def test_bounded(self):
+        value_type = type('Value', (object,), {})
+        self.assertFalse(utils.is_entity(value_type()))
+
+        # The type is remembered as not being an entity
+        Entity.register(value_type)
+        self.assertFalse(utils.is_entity(value_type()))
+
+        # Checking enough other types should cause it to be forgotten
+        for i in range(1000):
+            utils.is_entity(type('Value%d' % i, (object,), {})())
+        self.assertTrue(utils.is_entity(value_type()))
+
+
 if __name__ == '__main__':
     unittest.main()
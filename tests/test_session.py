@@ -3,7 +3,9 @@ import unittest
 import sys
 
 sys.path.insert(0, os.path.normpath(os.path.dirname(__file__)).rsplit(os.path.sep, 1)[0])
-from ftrack_query import FTrackQuery, exception, select
+from ftrack_api.entity.base import Entity
+from ftrack_query import FTrackQuery, exception, select, update, delete
+from ftrack_query.query import Update
 
 
 class TestSession(unittest.TestCase):
@@ -32,6 +34,126 @@ class TestSession(unittest.TestCase):
         del os.environ['FTRACK_API_PAGE_SIZE']
 
 
+class EntityType(object):
+    default_projections = ['id', 'name']
+
+
+class Task(Entity):
+    pass
+
+
+class TestExecuteMany(unittest.TestCase):
+
+    def setUp(self):
+        self.session = FTrackQuery(debug=True)
+        self.session.types = {'Task': EntityType}
+        self.batches = []
+
+        def call(batch):
+            self.batches.append(batch)
+            return [{'data': [i]} for i in range(len(batch))]
+        self.session.call = call
+
+    def test_batch(self):
+        results = self.session.execute_many([
+            select('Task').where(name='a').limit(5),
+            select('Task').populate('parent').limit(1),
+        ])
+        self.assertEqual(results, [[0], [1]])
+        self.assertEqual(self.batches, [[
+            {'action': 'query', 'expression': 'select id, name from Task where name is "a" limit 5'},
+            {'action': 'query', 'expression': 'select parent from Task limit 1'},
+        ]])
+
+    def test_merge(self):
+        entities = [Task.__new__(Task), Task.__new__(Task)]
+        self.session.call = lambda batch: [{'data': [entities[0], 'raw']}, {'data': [entities[1]]}]
+
+        merges = []
+
+        def merge_recursive(entity, merged):
+            merges.append((entity, merged))
+            return 'merged %d' % len(merges)
+        self.session._merge_recursive = merge_recursive
+
+        results = self.session.execute_many([
+            select('Task').limit(1),
+            select('Task').limit(1),
+        ])
+        self.assertEqual(results, [['merged 1', 'raw'], ['merged 2']])
+        self.assertEqual(len(merges), 2)
+        self.assertIs(merges[0][0], entities[0])
+        self.assertIs(merges[1][0], entities[1])
+        self.assertIs(merges[0][1], merges[1][1])
+
+    def test_empty(self):
+        self.assertEqual(self.session.execute_many([]), [])
+        self.assertEqual(self.batches, [])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.session.execute_many([select('Task')])
+        with self.assertRaises(TypeError):
+            self.session.execute_many([update('Task').limit(1)])
+        with self.assertRaises(TypeError):
+            self.session.execute_many([delete('Task').limit(1)])
+        with self.assertRaises(TypeError):
+            self.session.execute_many(['Task limit 1'])
+        self.assertEqual(self.batches, [])
+
+
+class QueryResult(list):
+    def all(self):
+        return self
+
+
+class QuerySession(object):
+    """Record queries instead of sending them."""
+
+    def __init__(self):
+        self.queries = []
+
+    def query(self, expression, page_size=None):
+        self.queries.append((expression, page_size))
+        return QueryResult([1, 2])
+
+
+class TestCount(unittest.TestCase):
+
+    def setUp(self):
+        self.session = QuerySession()
+
+    def test_select(self):
+        stmt = select('Task').where(name='a').populate('parent').order_by('name').limit(3)
+        self.assertEqual(stmt.count(self.session), 2)
+        self.assertEqual(len(stmt.options(session=self.session, page_size=10)), 2)
+        self.assertEqual(self.session.queries, [
+            ('select id from Task where name is "a" order by name limit 3', None),
+            ('select id from Task where name is "a" order by name limit 3', 10),
+        ])
+
+    def test_update(self):
+        def execute(*args, **kwargs):
+            raise AssertionError('update was executed')
+
+        original_execute = Update.execute
+        Update.execute = execute
+        try:
+            stmt = update('Task').where(name='a').values(name='b').limit(2)
+            self.assertEqual(stmt.count(self.session), 2)
+            self.assertEqual(len(stmt.options(session=self.session)), 2)
+        finally:
+            Update.execute = original_execute
+        self.assertEqual(self.session.queries, [
+            ('select id from Task where name is "a" limit 2', None),
+        ] * 2)
+
+    def test_delete(self):
+        stmt = delete('Task').where(name='a').options(session=self.session)
+        self.assertEqual(len(stmt), 2)
+        self.assertEqual(self.session.queries, [('select id from Task where name is "a"', None)])
+
+
 class TestException(unittest.TestCase):
 
     def setUp(self):
@@ -44,6 +166,9 @@ class TestException(unittest.TestCase):
         with self.assertRaises(exception.UnboundSessionError):
             self.session.select('Task').options(session=None).first()
 
+        with self.assertRaises(exception.UnboundSessionError):
+            select('Task').count()
+
 
 if __name__ == '__main__':
     unittest.main()